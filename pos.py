@@ -1,9 +1,166 @@
 from abc import ABC, abstractmethod
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache, total_ordering
+from numbers import Rational
 from typing import List
 from config import app_config
 
-def print48_charge(charge_name: str, charge_amount: float) -> str:
-        amount_str = f"{charge_amount:>6,.2f}"
+@lru_cache(maxsize=4096)
+def format_amount(cents: int) -> str:
+    """
+     Formats an amount in minor units (cents) as a string with thousands separators and 2 decimals, e.g. 149985 -> "1,499.85"
+    """
+    major, minor = divmod(abs(cents), 100)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{major:,}.{minor:02d}"
+
+@total_ordering
+class Money:
+    __slots__ = ("_cents",)
+
+    def __init__(self, cents: int = 0):
+        """
+         Represents a money amount as an exact integer number of minor units (cents).
+          - cents: The amount in minor units (e.g., 350 for $3.50). Use Money.of() to convert from a major unit amount.
+         Arithmetic between Money values is exact. Rounding only happens in Money.of() and Money.apply_rate(), both round half up.
+         Money compares with plain numbers by exact value in major units (e.g., Money(50000) == 500, Money(50) == 0.5).
+        """
+        assert _is_int(cents), "Money must be created from integer cents"
+        object.__setattr__(self, "_cents", cents)
+
+    @property
+    def cents(self) -> int:
+        return self._cents
+
+    @property
+    def value(self) -> Decimal:
+        """
+         The exact amount in major units (e.g., Decimal("3.50") for 350 cents).
+        """
+        return Decimal(f"{self._cents}e-2")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Money is immutable")
+
+    @staticmethod
+    def of(amount) -> "Money":
+        """
+         Converts a major unit amount (e.g., 3.50 or "3.50") to Money, rounding half up to the nearest cent.
+         Floats are converted through their shortest repr, so 2.675 rounds to 2.68.
+        """
+        if isinstance(amount, Money):
+            return amount
+        amount = _to_decimal(amount)
+        assert amount.is_finite(), "Amount must be a finite number"
+        numerator, denominator = amount.as_integer_ratio()
+        return Money(_round_half_up(numerator * 100, denominator))
+
+    def apply_rate(self, rate: float | Decimal) -> "Money":
+        """
+         Returns this amount multiplied by a rate (e.g., 0.125 for 12.5%), rounded half up to the nearest cent.
+        """
+        rate = _to_decimal(rate)
+        assert rate.is_finite(), "Rate must be a finite number"
+        numerator, denominator = rate.as_integer_ratio()
+        return Money(_round_half_up(self._cents * numerator, denominator))
+
+    def __add__(self, other: "Money") -> "Money":
+        if isinstance(other, Money):
+            return Money(self._cents + other._cents)
+        return NotImplemented
+
+    def __radd__(self, other) -> "Money":
+        # Allows sum() without an explicit Money start value
+        if isinstance(other, int) and other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: "Money") -> "Money":
+        if isinstance(other, Money):
+            return Money(self._cents - other._cents)
+        return NotImplemented
+
+    def __mul__(self, count: int) -> "Money":
+        if _is_int(count):
+            return Money(self._cents * count)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Money":
+        return Money(-self._cents)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Money):
+            return self._cents == other._cents
+        if isinstance(other, int):
+            return self._cents == other * 100
+        if isinstance(other, (float, Rational)):
+            return Fraction(self._cents, 100) == other
+        if isinstance(other, Decimal):
+            return not other.is_nan() and self.value == other
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, Money):
+            return self._cents < other._cents
+        if isinstance(other, int):
+            return self._cents < other * 100
+        if isinstance(other, (float, Rational)):
+            if other == other:  # not NaN
+                return Fraction(self._cents, 100) < other
+        elif isinstance(other, Decimal) and not other.is_nan():
+            return self.value < other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Same hash as equal ints, floats, Fractions and Decimals
+        major, minor = divmod(self._cents, 100)
+        return hash(major) if not minor else hash(Fraction(self._cents, 100))
+
+    def __bool__(self) -> bool:
+        return self._cents != 0
+
+    def __float__(self) -> float:
+        return self._cents / 100
+
+    def __str__(self) -> str:
+        return format_amount(self._cents)
+
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec:
+            return str(self)
+        return format(self.value, format_spec)
+
+    def __repr__(self) -> str:
+        return f"Money({self._cents})"
+
+def _is_int(number) -> bool:
+    return isinstance(number, int) and not isinstance(number, bool)
+
+def _round_half_up(numerator: int, denominator: int) -> int:
+    """
+     Rounds numerator / denominator (denominator > 0) to the nearest integer, halves away from zero. Exact for any size.
+    """
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+def _to_decimal(number) -> Decimal:
+    """
+     Converts a number to Decimal, floats through their shortest repr (0.1 -> Decimal("0.1")). Invalid input raises AssertionError.
+    """
+    if isinstance(number, Decimal):
+        return number
+    try:
+        return Decimal(str(number))
+    except ArithmeticError:
+        raise AssertionError(f"Invalid number: {number!r}")
+
+def print48_charge(charge_name: str, charge_amount: float | Money) -> str:
+        amount_str = str(Money.of(charge_amount)).rjust(6)
         name_len = 48 - len(amount_str) - 3
         name_str = f"{charge_name:<{name_len}.{name_len}}"
         return f" {name_str} {amount_str} "
@@ -18,56 +175,60 @@ class PosPrintable(ABC):
         pass
 
 class PosCharge:
-    def __init__(self, name: str, amount: float, fixed: bool = True):
+    def __init__(self, name: str, amount: float | Money, fixed: bool = True):
         """
          Represents an additional charge on the receipt, such as tax or service charge.
           - name: Description of the charge (e.g., "Tax", "Service Fee", "GST 12.5%")
           - amount: The amount of the charge (e.g., 5.00 for $5.00 for fixed, or 0.125 for 12.5% for a rate)
           - fixed: If True, the charge is a fixed amount; if False, it is a rate applied to the subtotal of taxable items.
+         A fixed amount is stored as Money, a rate is stored as a Decimal.
         """
         self.name = name.strip() if name else ""
         assert self.name and len(self.name) <= 15, "Charge name must be 1-15 characters"
         if fixed:
-            assert amount >= 0, "Fixed charge should not be negative"
+            self.amount = Money.of(amount)
+            assert self.amount.cents >= 0, "Fixed charge should not be negative"
         else:
-            assert 0.0 <= amount <= 1.0, "Rate charge should be between 0 and 1"
-        self.amount = amount
+            self.amount = _to_decimal(amount)
+            assert self.amount.is_finite(), "Rate charge must be a finite number"
+            assert 0 <= self.amount <= 1, "Rate charge should be between 0 and 1"
         self.fixed = fixed
 
 class PosChargeItem:
-    def __init__(self, charge: PosCharge, count: int = 1, base_amount: float = 0.0, name: str = ""):
+    def __init__(self, charge: PosCharge, count: int = 1, base_amount: float | Money = 0.0, name: str = ""):
         assert count > 0, f"{charge.name} - Count must be greater than 0"
         self.count = count
-        assert base_amount >= 0, f"{charge.name} - Base amount must be greater than or equal to 0"
-        self.base_amount = base_amount
+        self.base_amount = Money.of(base_amount)
+        assert self.base_amount.cents >= 0, f"{charge.name} - Base amount must be greater than or equal to 0"
         self.charge = charge
         self.name = name if name else charge.name
     
     @property
-    def total_amount(self) -> float:
+    def total_amount(self) -> Money:
         if self.charge.fixed:
-            return self.count * self.charge.amount
+            return self.charge.amount * self.count
         else:
-            return self.count * self.charge.amount * self.base_amount
+            # Rounded once on the whole charge, not per count
+            return (self.base_amount * self.count).apply_rate(self.charge.amount)
 
 class PosItem(PosPrintable):
-    def __init__(self, name: str, price: float, count: int = 1, note: str = ""):
+    def __init__(self, name: str, price: float | Money, count: int = 1, note: str = ""):
         self.name = name
-        assert price >= 0, f"{name} - Price must be greater than or equal to 0"
-        self.price = price
+        self.price = Money.of(price)
+        assert self.price.cents >= 0, f"{name} - Price must be greater than or equal to 0"
         assert count > 0, f"{name} - Count must be greater than 0"
         self.count = count
         self.note = note
 
     @property
-    def total_price(self) -> float:
+    def total_price(self) -> Money:
         return self.price * self.count
 
     def print48(self) -> List[str]:
         # Left-aligned and padded
         count_str = f"{self.count:>2}"
-        price_str = f"{self.price:>6,.2f}"
-        total_str = f"{self.total_price:>6,.2f}"
+        price_str = str(self.price).rjust(6)
+        total_str = str(self.total_price).rjust(6)
         sub_len = len(count_str) + len(price_str) + len(total_str) + 4  # spaces
         name_len = 48 - sub_len - 3  # 3 spaces: start, between name and count, and end
         if name_len < 10 and len(self.name) > name_len:
@@ -141,11 +302,11 @@ class PosOrder(PosPrintable):
         self.shop = shop
         assert items or extras, f"Order {order_id} must contain at least one item"
         self.items = items
-        self.sub_total = sum(i.total_price for i in items)
+        self.sub_total = sum((i.total_price for i in items), Money())
         self.extras = [PosChargeItem(charge=c, base_amount=self.sub_total) for c in extras]
-        self.sub_total_extras = sum(c.total_amount for c in self.extras)
+        self.sub_total_extras = sum((c.total_amount for c in self.extras), Money())
         self.surcharges = [PosChargeItem(charge=c, base_amount=self.sub_total) for c in self.shop.surcharges]
-        self.sub_total_surcharges = sum(c.total_amount for c in self.surcharges)
+        self.sub_total_surcharges = sum((c.total_amount for c in self.surcharges), Money())
         self.total = self.sub_total + self.sub_total_extras + self.sub_total_surcharges
         self.customer_name = customer_name.strip() if customer_name else ""
         self.customer_name = self.customer_name[:32] if self.customer_name else f"Customer {order_id}"
@@ -163,17 +324,17 @@ class PosOrder(PosPrintable):
 PAYMENT_METHODS = ["Cash", "CreditCard", "DebitCard", "ApplePay", "GooglePay", "Check", "PayPal", "Venmo", "Other"]
 
 class PosPayment:
-    def __init__(self, amount: float, method: str = "Other"):
+    def __init__(self, amount: float | Money, method: str = "Other"):
         self.method = method.strip() if method else ""
         assert self.method and len(self.method) <= 12, "Payment method must be 1-12 characters"
-        self.amount = amount
-        assert self.amount >= 0, "Payment amount must be greater than or equal to 0"
+        self.amount = Money.of(amount)
+        assert self.amount.cents >= 0, "Payment amount must be greater than or equal to 0"
 
 class PosOrderPayment(PosPrintable):
     def __init__(self, order: PosOrder, payments: List[PosPayment]):
         self.order = order
         self.payments = payments
-        total_paid = sum(payment.amount for payment in payments)
+        total_paid = sum((payment.amount for payment in payments), Money())
         assert total_paid >= self.order.total, f"Order {self.order.order_id} - Total payment must be >= order total ({self.order.total})"
         self.change = total_paid - self.order.total
 
@@ -39,7 +39,7 @@ def print_receipt():
 
     _payements = [
         pos.PosPayment(method="Cash", amount=50.00),
-        pos.PosPayment(method="CreditCard", amount=_order.total-45.00)
+        pos.PosPayment(method="CreditCard", amount=_order.total - pos.Money.of(45.00))
     ]
     _order_payments = pos.PosOrderPayment(order=_order, payments=_payements)
 
@@ -106,7 +106,7 @@ def print_receipt():
     # Grand Total (Double Size)
     p.set(font='b', align='center')
     p._raw(b'\x1d\x21\x11')  # double width + double height
-    p.text(f"Grand Total: {_order.total:.2f}\n")
+    p.text(f"Grand Total: {_order.total}\n")
     p._raw(b'\x1d\x21\x00')  # reset to normal
 
     # Finalize
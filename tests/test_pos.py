@@ -1,12 +1,111 @@
 import unittest
 import sys
 import os
+from decimal import Decimal
+from fractions import Fraction
 
 # Add the parent directory to sys.path so we can import formatter_util
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import pos
 
+class TestMoney(unittest.TestCase):
+
+    def test_Money_of(self):
+        self.assertEqual(pos.Money.of(3.50).cents, 350)
+        self.assertEqual(pos.Money.of(0.1).cents, 10)
+        self.assertEqual(pos.Money.of(2.675).cents, 268)   # half up from the shortest repr
+        self.assertEqual(pos.Money.of("16.505").cents, 1651)
+        self.assertEqual(pos.Money.of(1499999999850).cents, 149999999985000)
+        m = pos.Money(250)
+        self.assertIs(pos.Money.of(m), m)
+        self.assertEqual(pos.Money.of(Decimal("1e30")).cents, 10**32)
+        self.assertEqual(pos.Money.of(Decimal("123456789012345678901234567890.125")).cents, 12345678901234567890123456789013)
+        for cents in [2.5, True]:
+            with self.subTest(cents=cents):
+                with self.assertRaises(AssertionError):
+                    pos.Money(cents)
+        for amount in [float("nan"), float("inf"), "abc", None]:
+            with self.subTest(amount=amount):
+                with self.assertRaises(AssertionError):
+                    pos.Money.of(amount)
+        m = pos.Money(250)
+        with self.assertRaises(AttributeError):
+            m.cents = 300
+        self.assertEqual(m.cents, 250)
+
+    def test_Money_arithmetic(self):
+        a, b = pos.Money.of(0.1), pos.Money.of(0.2)
+        self.assertEqual(a + b, pos.Money.of(0.3))  # exact, unlike floats
+        self.assertEqual(sum([a, b, a]), pos.Money(40))
+        self.assertEqual(b - a, pos.Money(10))
+        self.assertEqual(a * 3, pos.Money(30))
+        self.assertEqual(3 * a, pos.Money(30))
+        self.assertTrue(a < b)
+        self.assertTrue(b >= a)
+        self.assertFalse(pos.Money())
+        with self.assertRaises(TypeError):
+            a * True
+
+    def test_Money_compare_numbers(self):
+        self.assertEqual(pos.Money(0), 0)
+        self.assertEqual(pos.Money(50000), 500)
+        self.assertEqual(pos.Money(50000), 500.0)
+        self.assertEqual(pos.Money(50), 0.5)
+        self.assertNotEqual(pos.Money(10), 0.1)             # floats compare by exact binary value
+        self.assertEqual(pos.Money(10), Decimal("0.1"))
+        self.assertEqual(pos.Money(50), Fraction(1, 2))
+        self.assertEqual(pos.Money(100), True)
+        self.assertNotEqual(pos.Money(4950), True)
+        self.assertNotEqual(pos.Money(4950), float("nan"))
+        self.assertNotEqual(pos.Money(4950), Decimal("NaN"))
+        self.assertIn(pos.Money(50), {0.5})
+        self.assertNotIn(pos.Money(10), {0.1})
+        self.assertEqual([1, 2, pos.Money(300)].index(3), 2)
+        with self.assertRaises(TypeError):
+            pos.Money(100) > float("nan")
+        self.assertTrue(pos.Money(49) < Fraction(1, 2))
+        self.assertTrue(pos.Money(10**30) > Decimal("1e27"))
+        self.assertEqual(pos.Money(1250), Decimal("12.5"))
+        self.assertNotEqual(pos.Money(10), 0.11)
+        self.assertTrue(pos.Money(100) > 0)
+        self.assertTrue(pos.Money(-1) < 0)
+        self.assertTrue(pos.Money(150) >= 1.5)
+        self.assertEqual(hash(pos.Money(50000)), hash(500))
+        self.assertEqual(hash(pos.Money(50)), hash(0.5))
+        self.assertEqual(hash(pos.Money(10)), hash(Decimal("0.1")))
+        self.assertNotEqual(pos.Money(100), "1.00")
+        self.assertEqual(float(pos.Money(1650)), 16.5)
+
+    def test_Money_apply_rate(self):
+        self.assertEqual(pos.Money(100).apply_rate(0.1), pos.Money(10))
+        self.assertEqual(pos.Money(10000).apply_rate(Decimal("0.125")), pos.Money(1250))
+        self.assertEqual(pos.Money(1999).apply_rate(Decimal("0.15")), pos.Money(300))   # 299.85 -> 300
+        self.assertEqual(pos.Money(1001).apply_rate(Decimal("0.05")), pos.Money(50))    # 50.05 -> 50
+        self.assertEqual(pos.Money(1010).apply_rate(Decimal("0.05")), pos.Money(51))    # 50.5 -> 51
+        self.assertEqual(pos.Money(-1010).apply_rate(Decimal("0.05")), pos.Money(-51))  # halves away from zero
+        self.assertEqual(pos.Money(10**30).apply_rate(Decimal("0.125")), pos.Money(125 * 10**27))
+        self.assertEqual(pos.Money(10**30 + 1).apply_rate(Decimal("0.5")), pos.Money(5 * 10**29 + 1))
+
+    def test_Money_format(self):
+        self.assertEqual(str(pos.Money(0)), "0.00")
+        self.assertEqual(str(pos.Money(5)), "0.05")
+        self.assertEqual(str(pos.Money(149985000)), "1,499,850.00")
+        self.assertEqual(str(pos.Money(-1650)), "-16.50")
+        self.assertEqual(f"{pos.Money(149985000)}", "1,499,850.00")
+        self.assertEqual(f"{pos.Money(149985000):.2f}", "1499850.00")
+        self.assertEqual(f"{pos.Money(4950):>10}", "     49.50")
+        self.assertEqual(f"{pos.Money(4950):*<8}", "49.50***")
+        self.assertEqual(f"{pos.Money(4950):06}", "049.50")
+        self.assertEqual(f"{pos.Money(4950):+}", "+49.50")
+        self.assertEqual(f"{pos.Money(-4950):=10}", "-    49.50")
+        self.assertEqual(f"{pos.Money(149985000):>15,}", "   1,499,850.00")
+        self.assertEqual(f"{pos.Money(10**30):.2f}", "1" + "0" * 28 + ".00")
+        self.assertEqual(f"{pos.Money(123456789012345678):.2f}", "1234567890123456.78")
+        self.assertEqual(f"{pos.Money(123456789012345678):,.2f}", "1,234,567,890,123,456.78")
+        self.assertEqual(pos.format_amount(123456789), "1,234,567.89")
+        self.assertEqual(pos.print48_charge("Tip", 3.5), " Tip                                       3.50 ")
+
 class TestPosCharge(unittest.TestCase):
 
     def test_PosCharge_init(self):
@@ -24,6 +123,8 @@ class TestPosCharge(unittest.TestCase):
             ("Fixed Charge", -5.0, True),         # Negative fixed amount
             ("Service Charge", 1.5, False),         # Rate > 1.0
             ("Service Charge", -0.1, False),        # Rate < 0.0
+            ("Fixed Charge", float("nan"), True),   # Invalid fixed amount
+            ("Service Charge", "abc", False),       # Invalid rate
         ]
         for name, amount, fixed in invalid_cases:
             with self.subTest(name=name, amount=amount, fixed=fixed):
@@ -41,6 +142,7 @@ class TestPosChargeItem(unittest.TestCase):
             (c, 0, 5.0),   # Count = 0
             (c, -1, 5.0),  # Negative count
             (c, 2, -5.0),  # Negative base_amount
+            (c, 2, float("nan")),  # Invalid base_amount
         ]
         for c, count, base_amount in invalid_cases:
             with self.subTest(count=count, base_amount=base_amount):
@@ -49,9 +151,10 @@ class TestPosChargeItem(unittest.TestCase):
     
     def test_PosChargeItem_total_amount(self):
         c_rate = pos.PosCharge(name="Tax", amount=0.125, fixed=False)
-        self.assertEqual(pos.PosChargeItem(charge=c_rate, count=2, base_amount=100.0).total_amount, 25.0) # 12.5% of 100 * 2
+        self.assertEqual(pos.PosChargeItem(charge=c_rate, count=2, base_amount=100.0).total_amount, pos.Money.of(25.0)) # 12.5% of 100 * 2
+        self.assertEqual(pos.PosChargeItem(charge=c_rate, count=1, base_amount=0.99).total_amount, pos.Money.of(0.12)) # 0.12375 rounded
         c_fixed = pos.PosCharge(name="Service Fee", amount=5.0, fixed=True)
-        self.assertEqual(pos.PosChargeItem(charge=c_fixed, count=3, base_amount=5.0).total_amount, 15.0) # 5 * 3
+        self.assertEqual(pos.PosChargeItem(charge=c_fixed, count=3, base_amount=5.0).total_amount, pos.Money.of(15.0)) # 5 * 3
 
 class TestPosItem(unittest.TestCase):
     
@@ -62,6 +165,8 @@ class TestPosItem(unittest.TestCase):
             ("Milk", -150.00, 1),  # Negative price
             ("Bread", 50.00, 0),   # Count = 0
             ("Eggs", 30.00, -1),   # Negative count
+            ("Salt", float("nan"), 1),  # Invalid price
+            ("Sugar", "abc", 1),   # Invalid price
         ]
         for name, price, count in invalid_cases:
             with self.subTest(name=name, price=price, count=count):
@@ -69,7 +174,7 @@ class TestPosItem(unittest.TestCase):
                     pos.PosItem(name=name, price=price, count=count)
     
     def test_PosItem_total_price(self):
-        self.assertEqual(pos.PosItem(name="Apple Juice", price=250.00, count=2).total_price, 500.00)
+        self.assertEqual(pos.PosItem(name="Apple Juice", price=250.00, count=2).total_price, pos.Money.of(500.00))
     
     def test_PosItem_print48(self):
         self.assertEqual(
@@ -164,14 +269,14 @@ class TestPosOrder(unittest.TestCase):
         self.assertEqual(order4.notes, ["Please pack the cookie carefully as it's a",
                                         "gift. This note is too long and should be split", 
                                         "into multiple lines."])
-        expected_sub_total = 2*250.00 + 180.00
-        self.assertAlmostEqual(order4.sub_total, expected_sub_total)
-        expected_sub_total_extras = 150.00 + 0.1*expected_sub_total
-        self.assertAlmostEqual(order4.sub_total_extras, expected_sub_total_extras)
-        expected_sub_total_surcharges = 17.00 + 0.15*expected_sub_total
-        self.assertAlmostEqual(order4.sub_total_surcharges, expected_sub_total_surcharges)
+        expected_sub_total = pos.Money(25000)*2 + pos.Money(18000)
+        self.assertEqual(order4.sub_total, expected_sub_total)
+        expected_sub_total_extras = pos.Money(15000) + pos.Money(6800)
+        self.assertEqual(order4.sub_total_extras, expected_sub_total_extras)
+        expected_sub_total_surcharges = pos.Money(1700) + pos.Money(10200)
+        self.assertEqual(order4.sub_total_surcharges, expected_sub_total_surcharges)
         expected_total = expected_sub_total + expected_sub_total_extras + expected_sub_total_surcharges
-        self.assertAlmostEqual(order4.total, expected_total)
+        self.assertEqual(order4.total, expected_total)
 
         invalid_cases = [
             ("", sp1, [pos.PosItem(name="Apple Juice", price=250.00, count=2)], []),  # Empty order ID
@@ -183,7 +288,33 @@ class TestPosOrder(unittest.TestCase):
                     pos.PosOrder(order_id=order_id, shop=shop, items=items, extras=extras)
 
     def test_PosOrder_print48(self):
-        pass
+        sp=pos.PosShop(name="My Shop", address1="123 Main St", city="Colombo", state="Western", zip_code="12345", phone="0123456780",
+                       surcharges=[pos.PosCharge(name="Tax", amount=0.15, fixed=False)])
+        order = pos.PosOrder(order_id="ORD001", shop=sp, items=[pos.PosItem(name="Pan Cake", price=16.50, count=3)],
+                             extras=[pos.PosCharge(name="Donation", amount=1000.00, fixed=True)])
+        self.assertEqual(order.print48(), [
+            " Subtotal                                 49.50 ",
+            " Tax                                       7.43 ",
+            " Donation                              1,000.00 ",
+            " Total                                 1,056.93 "])
+
+class TestPosOrderPayment(unittest.TestCase):
+
+    def test_PosOrderPayment_init(self):
+        sp=pos.PosShop(name="My Shop", address1="123 Main St", city="Colombo", state="Western", zip_code="12345", phone="0123456780")
+        order = pos.PosOrder(order_id="ORD001", shop=sp, items=[pos.PosItem(name="Candy", price=0.1, count=3)])
+        self.assertEqual(order.total, pos.Money(30))
+        exact = pos.PosOrderPayment(order=order, payments=[pos.PosPayment(amount=0.1), pos.PosPayment(amount=0.2)]) # 0.1 + 0.2 == 0.3 exactly
+        self.assertEqual(exact.change, pos.Money())
+        self.assertEqual(exact.print48(), [
+            " Other                                     0.10 ",
+            " Other                                     0.20 "])
+        with_change = pos.PosOrderPayment(order=order, payments=[pos.PosPayment(amount=1.00, method="Cash")])
+        self.assertEqual(with_change.print48(), [
+            " Cash                                      1.00 ",
+            " Change                                    0.70 "])
+        with self.assertRaises(AssertionError):
+            pos.PosOrderPayment(order=order, payments=[pos.PosPayment(amount=0.29)])
 
         
 if __name__ == '__main__':